@@ -1,70 +1,204 @@
 import re
+import copy
+import atexit
+import queue
 import sys
+import time
+import threading
 import json
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import requests
-import warnings
-from datetime import datetime, date
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
+from types import MappingProxyType
 
-# 配置日志
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
+# orjson为可选依赖，未安装时使用标准库json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 后台日志线程，由main()启动，导入本模块时不创建线程和日志文件
+log_listener = None
+
+def setup_logging():
+    """配置日志：日志先放入队列，由后台线程写入控制台和文件，避免磁盘写入阻塞网络请求"""
+    global log_listener
+    if log_listener is not None:
+        return
+    
+    log_queue = queue.Queue()
+    log_listener = QueueListener(
+        log_queue,
         logging.StreamHandler(),
         logging.FileHandler('fan_control.log')
-    ]
-)
+    )
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[QueueHandler(log_queue)]
+    )
+    log_listener.start()
+    # 程序退出时写完队列中剩余的日志
+    atexit.register(log_listener.stop)
+
+def json_loads(data):
+    """解析JSON，安装了orjson时使用orjson加速"""
+    # orjson不支持UTF-8 BOM，统一先去掉
+    if data.startswith(b'\xef\xbb\xbf'):
+        data = data[3:]
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj):
+    """序列化JSON为单行字符串，安装了orjson时使用orjson加速"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+# BMC使用自签名证书，只屏蔽未校验证书的警告，不影响其他警告
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# 配置文件路径
+CONFIG_PATH = Path('fanSpeed.json')
+
+# 节假日缓存文件，记录当天API查询结果，避免重复联网
+HOLIDAY_CACHE_PATH = Path('holiday_cache.json')
+
+# 风扇状态缓存文件，记录各服务器上次的ETag/Last-Modified和状态数据，供下次运行做条件请求
+FAN_STATUS_CACHE_PATH = Path('fan_status_cache.json')
+
+# 每台服务器连接池保留的最大长连接数，同时也是单台服务器并发风扇请求的上限
+POOL_MAXSIZE = 32
+
+def create_session():
+    """创建所有服务器共用的会话，复用TCP/TLS连接"""
+    session = requests.Session()
+    session.verify = False
+    # BMC偶发的5xx或连接中断时自动重试，避免整台服务器的流程失败
+    # 登录POST携带一次性的login_tag，重试无意义，因此只重试GET和PUT
+    retry_options = dict(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    try:
+        retry = Retry(allowed_methods=["GET", "PUT"], **retry_options)
+    except TypeError:
+        # urllib3 1.26 之前的版本使用 method_whitelist 参数
+        retry = Retry(method_whitelist=["GET", "PUT"], **retry_options)
+    # 连接池需容纳多台服务器及每台服务器并发的风扇请求
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+    session.mount('https://', adapter)
+    return session
+
+# 从Set-Cookie头中提取会话ID
+SESSION_COOKIE_RE = re.compile(r'(?:^|[;,]\s*)(?:QSESSIONID|SESSION)=([^;,\s]+)')
+
+# 全局共享会话，各服务器的登录信息保存在各自控制器的请求头中
+SESSION = create_session()
+
+# 成功加载的配置缓存及对应的文件修改时间；文件未修改时不再读取和解析，加载失败时不缓存
+_loaded_config = None
+_loaded_config_mtime = None
 
 # 加载配置文件
 def load_config():
-    config_path = Path('fanSpeed.json')
-    if config_path.exists():
+    global _loaded_config, _loaded_config_mtime
+    try:
+        mtime = CONFIG_PATH.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    
+    if mtime is not None and mtime != _loaded_config_mtime:
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-                # 确保返回的是配置数组
-                if isinstance(config_data, list):
-                    return config_data
-                else:
-                    # 如果是单个配置，转换为数组
-                    return [config_data]
+            config_data = json_loads(CONFIG_PATH.read_bytes())
+            # 确保返回的是配置数组
+            if isinstance(config_data, list):
+                _loaded_config = config_data
+            else:
+                # 如果是单个配置，转换为数组
+                _loaded_config = [config_data]
+            _loaded_config_mtime = mtime
         except Exception as e:
             logging.error(f"加载配置文件失败：{e}")
+            _loaded_config = None
+            _loaded_config_mtime = None
+    elif mtime is None:
+        _loaded_config = None
+        _loaded_config_mtime = None
+    
+    # 返回副本，调用方修改不会影响缓存
+    if _loaded_config is not None:
+        return copy.deepcopy(_loaded_config)
     
     # 当配置文件不存在或加载失败时返回空数组
     return []
 
+def load_fan_status_cache():
+    """读取风扇状态缓存文件，返回 {host: {etag, last_modified, expires, fan_info}} 字典"""
+    if FAN_STATUS_CACHE_PATH.exists():
+        try:
+            cache = json_loads(FAN_STATUS_CACHE_PATH.read_bytes())
+            if isinstance(cache, dict):
+                return cache
+        except Exception as e:
+            logging.warning(f"读取风扇状态缓存失败：{e}")
+    return {}
+
+def save_fan_status_cache(cache):
+    """写入风扇状态缓存文件"""
+    try:
+        FAN_STATUS_CACHE_PATH.write_text(json_dumps(cache), encoding='utf-8')
+    except Exception as e:
+        logging.warning(f"写入风扇状态缓存失败：{e}")
+
 class FanController:
-    def __init__(self, config):
+    # 所有请求共用的基础请求头，只读，登录后在其基础上生成带认证信息的请求头
+    _BASE_HEADERS = MappingProxyType({
+        "content-type": "application/json",
+        "User-Agent": r"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36 Edg/117.0.2045.60",
+    })
+
+    # 各服务器风扇状态缓存，首次使用时从缓存文件加载，多线程读写需加锁
+    _status_cache = None
+    _status_cache_lock = threading.Lock()
+
+    def __init__(self, config, session=None):
         self.host = config['bmc_host']
         self.username = config['username']
         self.password = config['password']
         self.fans_count = config['fans_count']
-        self.session = requests.Session()
-        self.session.verify = False
-        self.headers = {
-            "content-type": "application/json",
-            "User-Agent": r"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36 Edg/117.0.2045.60",
-        }
-        warnings.filterwarnings("ignore")
+        self.session = session or SESSION
+        # 预先生成各接口地址，避免每次请求重复拼接
+        self.base_url = f"https://{self.host}/api"
+        self._random_url = f"{self.base_url}/randomtag"
+        self._session_url = f"{self.base_url}/session"
+        self._fans_mode_url = f"{self.base_url}/settings/fans-mode"
+        self._fan_info_url = f"{self.base_url}/status/fan_info"
+        self._fan_urls = [f"{self.base_url}/settings/fan/{i}" for i in range(self.fans_count)]
+        self.headers = self._BASE_HEADERS
 
     def get_random(self):
         try:
-            url = f"https://{self.host}/api/randomtag"
-            res = self.session.get(url, headers=self.headers)
+            res = self.session.get(self._random_url, headers=self.headers)
             res.raise_for_status()
-            return res.json()["random"]
+            return json_loads(res.content)["random"]
         except Exception as e:
-            logging.error(f"获取随机标签失败：{e}")
+            logging.error(f"服务器 {self.host} 获取随机标签失败：{e}")
             raise
 
     def login(self):
         try:
             random_string = self.get_random()
-            url = f"https://{self.host}/api/session"
-            self.headers["content-type"] = "application/x-www-form-urlencoded; charset=UTF-8"
+            headers = {**self._BASE_HEADERS, "content-type": "application/x-www-form-urlencoded; charset=UTF-8"}
             
             data = {
                 "encrypt_flag": 0,
@@ -73,81 +207,164 @@ class FanController:
                 "login_tag": str(random_string)
             }
             
-            response = self.session.post(url, headers=self.headers, data=data)
+            response = self.session.post(self._session_url, headers=headers, data=data)
             response.raise_for_status()
             
             if "Set-Cookie" not in response.headers:
                 raise ValueError("响应中没有Set-Cookie头")
             
-            cookies = response.headers["Set-Cookie"].split(';')
-            session_id = None
-            
-            for cookie in cookies:
-                cookie = cookie.strip()
-                if cookie.startswith(("SESSION=", "QSESSIONID=")):
-                    session_id = cookie.split('=')[1]
-                    break
-            
-            if not session_id:
+            match = SESSION_COOKIE_RE.search(response.headers["Set-Cookie"])
+            if not match:
                 raise ValueError("无法获取会话ID")
+            session_id = match.group(1)
             
-            response_json = response.json()
+            response_json = json_loads(response.content)
             if "CSRFToken" not in response_json:
                 raise ValueError("无法获取CSRFToken")
             
-            self.headers["X-Csrftoken"] = response_json["CSRFToken"]
-            self.headers["Cookie"] = f"lang=zh-cn;QSESSIONID={session_id}; refresh_disable=1"
-            self.headers["content-type"] = "application/json"
+            # 登录后请求头不再修改，可安全地在并发请求间共享
+            self.headers = MappingProxyType({
+                **self._BASE_HEADERS,
+                "X-Csrftoken": response_json["CSRFToken"],
+                "Cookie": f"lang=zh-cn;QSESSIONID={session_id}; refresh_disable=1",
+            })
             
-            logging.info("登录成功")
+            logging.info(f"服务器 {self.host} 登录成功")
             
         except Exception as e:
-            logging.error(f"登录失败：{e}")
+            logging.error(f"服务器 {self.host} 登录失败：{e}")
             raise
 
+    def get_fan_mode(self):
+        """查询当前风扇模式，查询失败时返回None"""
+        try:
+            response = self.session.get(self._fans_mode_url, headers=self.headers)
+            response.raise_for_status()
+            return json_loads(response.content).get("control_mode")
+        except Exception as e:
+            logging.warning(f"服务器 {self.host} 获取风扇模式失败：{e}")
+            return None
+
     def set_fan_mode(self, mode="manual"):
+        # 已处于目标模式时无需重复设置
+        if self.get_fan_mode() == mode:
+            logging.info(f"服务器 {self.host} 风扇模式已为：{mode}，无需设置")
+            return
+        
         try:
-            url = f"https://{self.host}/api/settings/fans-mode"
             data = {"control_mode": mode}
-            response = self.session.put(url, headers=self.headers, json=data)
+            response = self.session.put(self._fans_mode_url, headers=self.headers, json=data)
             response.raise_for_status()
-            logging.info(f"设置风扇模式为：{mode}")
+            self._expire_status_cache()
+            logging.info(f"服务器 {self.host} 设置风扇模式为：{mode}")
         except Exception as e:
-            logging.error(f"设置风扇模式失败：{e}")
+            logging.error(f"服务器 {self.host} 设置风扇模式失败：{e}")
             raise
 
+    def _set_one_fan(self, index, url, speed):
+        try:
+            data = {"duty": speed}
+            response = self.session.put(url=url, json=data, headers=self.headers)
+            response.raise_for_status()
+            response_data = json_loads(response.content)
+            logging.info(f"服务器 {self.host} 风扇 {index} 转速已设置为 {response_data['duty']}%")
+            return True
+        except Exception as e:
+            logging.error(f"服务器 {self.host} 设置风扇 {index} 转速失败：{e}")
+            return False
+
     def set_fan_speed(self, speed):
-        success_count = 0
-        for i in range(self.fans_count):
-            try:
-                url = f'https://{self.host}/api/settings/fan/{i}'
-                data = {"duty": speed}
-                response = self.session.put(url=url, json=data, headers=self.headers)
-                response.raise_for_status()
-                response_data = response.json()
-                logging.info(f"风扇 {i} 转速已设置为 {response_data['duty']}%")
-                success_count += 1
-            except Exception as e:
-                logging.error(f"设置风扇 {i} 转速失败：{e}")
+        # 并发下发各风扇转速，避免逐个等待请求返回
+        # 并发请求时连接池中空闲连接不足，会为每个风扇新建TLS连接；
+        # 并发数不超过连接池大小，保证这些新连接用完后都能放回连接池供后续请求复用，而不是被丢弃
+        workers = max(min(self.fans_count, POOL_MAXSIZE), 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(self._set_one_fan, range(self.fans_count), self._fan_urls, [speed] * self.fans_count)
+            success_count = sum(results)
+        self._expire_status_cache()
         
         return success_count
 
+    def _get_cached_status(self):
+        """获取本服务器的风扇状态缓存，没有或格式不对时返回None"""
+        with self._status_cache_lock:
+            if FanController._status_cache is None:
+                FanController._status_cache = load_fan_status_cache()
+            cached = FanController._status_cache.get(self.host)
+        if isinstance(cached, dict) and cached.get('fan_info') is not None:
+            return cached
+        return None
+
+    def _store_cached_status(self, entry):
+        """更新本服务器的风扇状态缓存并写回缓存文件"""
+        with self._status_cache_lock:
+            if FanController._status_cache is None:
+                FanController._status_cache = load_fan_status_cache()
+            FanController._status_cache[self.host] = entry
+            save_fan_status_cache(FanController._status_cache)
+
+    def _expire_status_cache(self):
+        """风扇设置变更后使缓存立即过期，下次查询必须向BMC确认，保留校验值用于条件请求"""
+        cached = self._get_cached_status()
+        if cached and cached.get('expires', 0) > time.time():
+            self._store_cached_status({**cached, 'expires': 0})
+
+    def _fetch_fan_info(self):
+        """获取风扇状态，利用ETag/Last-Modified做条件请求，未变化时复用缓存数据"""
+        cached = self._get_cached_status()
+        
+        # 缓存仍在Cache-Control: max-age有效期内，直接使用
+        if cached and cached.get('expires', 0) > time.time():
+            return cached['fan_info']
+        
+        headers = dict(self.headers)
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        response = self.session.get(self._fan_info_url, headers=headers)
+        response.raise_for_status()
+        
+        # 304表示状态未变化，无需重新解析响应体
+        if response.status_code == 304 and cached:
+            fan_info = cached['fan_info']
+        else:
+            fan_info = json_loads(response.content)
+        
+        # 304响应可能不带ETag/Last-Modified，此时沿用之前的校验值
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if response.status_code == 304 and cached:
+            etag = etag or cached.get('etag')
+            last_modified = last_modified or cached.get('last_modified')
+        
+        # 有效期使用系统时间，以便跨进程持久化
+        max_age = re.search(r'max-age=(\d+)', response.headers.get('Cache-Control', ''))
+        self._store_cached_status({
+            'etag': etag,
+            'last_modified': last_modified,
+            'expires': time.time() + (int(max_age.group(1)) if max_age else 0),
+            'fan_info': fan_info,
+        })
+        return fan_info
+
     def get_fan_status(self):
         try:
-            url = f"https://{self.host}/api/status/fan_info"
-            response = self.session.get(url, headers=self.headers)
-            response.raise_for_status()
-            fan_info = response.json()
+            fan_info = self._fetch_fan_info()
             
-            if 'fans' in fan_info:
-                logging.info("\n当前风扇状态：")
-                for fan in fan_info['fans']:
-                    logging.info(json.dumps(fan, indent=2, ensure_ascii=False))
+            fans = fan_info.get('fans')
+            if fans is not None:
+                # 每个风扇输出一行紧凑JSON，不再逐个格式化缩进
+                logging.info(f"\n服务器 {self.host} 当前风扇状态：")
+                for fan in fans:
+                    logging.info(f"服务器 {self.host} {json_dumps(fan)}")
             else:
-                logging.warning("未获取到风扇信息")
+                logging.warning(f"服务器 {self.host} 未获取到风扇信息")
                 
         except Exception as e:
-            logging.error(f"获取风扇状态失败：{e}")
+            logging.error(f"服务器 {self.host} 获取风扇状态失败：{e}")
             raise
 
 def get_fan_speed_input():
@@ -167,16 +384,63 @@ def get_fan_speed_input():
     # 未指定参数时返回None，表示需要自动判断执行模式
     return None
 
-def is_weekend():
-    """判断当前是否为周末"""
-    today = datetime.now().weekday()
-    # 周六(5)或周日(6)为周末
-    return today >= 5
+# 本地节假日列表 (月, 日)，节假日API不可用时作为备用
+HOLIDAYS = (
+    (1, 1),  # 元旦
+    (1, 2),  # 元旦假期
+    (1, 3),  # 元旦假期
+    (4, 4),  # 清明节
+    (4, 5),  # 清明节
+    (5, 1),  # 劳动节
+    (5, 2),  # 劳动节
+    (5, 3),  # 劳动节
+    (10, 1), # 国庆节
+    (10, 2), # 国庆节
+    (10, 3), # 国庆节
+    (10, 4), # 国庆节
+    (10, 5)  # 国庆节
+)
+
+# 以 月*32+日 作为位序号把节假日打包成整数位图，查询只需一次移位和按位与
+# 不使用一年中的第几天作为序号，避免闰年与平年在3月之后错位
+HOLIDAY_BITMAP = sum(1 << (month << 5 | day) for month, day in HOLIDAYS)
+
+def load_holiday_cache():
+    """读取节假日缓存文件，返回 {日期: 是否节假日} 字典"""
+    if HOLIDAY_CACHE_PATH.exists():
+        try:
+            cache = json_loads(HOLIDAY_CACHE_PATH.read_bytes())
+            if isinstance(cache, dict):
+                return cache
+        except Exception as e:
+            logging.warning(f"读取节假日缓存失败：{e}")
+    return {}
+
+def save_holiday_cache(cache):
+    """写入节假日缓存文件"""
+    try:
+        HOLIDAY_CACHE_PATH.write_text(json_dumps(cache), encoding='utf-8')
+    except Exception as e:
+        logging.warning(f"写入节假日缓存失败：{e}")
 
 def is_chinese_holiday():
     """判断当前是否为中国国定节假日或周末（根据API信息）"""
     today = date.today()
     
+    # 周六(5)或周日(6)为周末，无需联网查询，直接按非工作日处理
+    if today.weekday() >= 5:
+        logging.info(f"{today} 是周末，跳过节假日API查询")
+        return True
+    
+    cache_key = today.isoformat()
+    
+    # 同一天的节假日状态不会变化，优先使用当天的缓存结果
+    cache = load_holiday_cache()
+    if cache_key in cache:
+        is_holiday = cache[cache_key]
+        logging.info(f"通过本地缓存确认 {today} {'是' if is_holiday else '不是'}中国节假日或周末")
+        return is_holiday
+    
     try:
         # 使用免费的节假日API获取最新数据
         # 格式化日期为YYYYMMDD格式
@@ -186,7 +450,7 @@ def is_chinese_holiday():
         response.raise_for_status()  # 如果状态码不是200，抛出异常
         
         # 解析响应数据
-        data = response.json()
+        data = json_loads(response.content)
         
         # 检查是否为节假日或周末
         # API返回的type: 0=工作日, 1=周末, 2=节假日
@@ -195,33 +459,20 @@ def is_chinese_holiday():
                 logging.info(f"通过API确认 {today} 是中国节假日")
             else:
                 logging.info(f"通过API确认 {today} 是周末")
-            return True
+            is_holiday = True
         else:
             logging.info(f"通过API确认 {today} 不是中国节假日或周末")
-            return False
+            is_holiday = False
+        
+        # 只缓存API确认的结果，且仅保留当天的记录
+        save_holiday_cache({cache_key: is_holiday})
+        return is_holiday
     except Exception as e:
         logging.warning(f"获取节假日API数据失败: {str(e)}，使用本地节假日列表")
         
         # 如果API调用失败，使用本地的硬编码节假日列表作为备用
-        # 节假日列表 (月, 日)
-        holidays = [
-            (1, 1),  # 元旦
-            (1, 2),  # 元旦假期
-            (1, 3),  # 元旦假期
-            (4, 4),  # 清明节
-            (4, 5),  # 清明节
-            (5, 1),  # 劳动节
-            (5, 2),  # 劳动节
-            (5, 3),  # 劳动节
-            (10, 1), # 国庆节
-            (10, 2), # 国庆节
-            (10, 3), # 国庆节
-            (10, 4), # 国庆节
-            (10, 5)  # 国庆节
-        ]
-        
         # 检查今天是否在节假日列表中
-        is_holiday = (today.month, today.day) in holidays
+        is_holiday = bool(HOLIDAY_BITMAP >> (today.month << 5 | today.day) & 1)
         if is_holiday:
             logging.info(f"通过本地列表确认 {today} 是中国节假日")
         else:
@@ -229,13 +480,49 @@ def is_chinese_holiday():
         
         return is_holiday
 
-def main():
+def process_config(index, total, config, target):
+    """执行单个服务器配置的风扇控制流程"""
     try:
-        # 首先检查节假日状态（显示联网更新是否成功）
-        logging.info("正在检查节假日状态...")
-        # 调用is_chinese_holiday()函数获取最新的节假日数据
-        is_holiday = is_chinese_holiday()
+        description = config.get('description', '未命名服务器')
+        logging.info(f"\n===== 执行配置 {index+1}/{total} - {description} ({config.get('bmc_host')}) =====")
+        
+        # 创建控制器实例
+        controller = FanController(config)
+        
+        # 执行控制流程
+        controller.login()
+        
+        # 根据目标类型执行不同操作
+        if target == 'auto':
+            controller.set_fan_mode("auto")
+            logging.info(f"服务器 {config['bmc_host']} 的风扇已设置为自动模式")
+        else:
+            # 如果当前配置有独立的fan_speed，则使用它
+            if 'fan_speed' in config:
+                current_speed = config['fan_speed']
+            else:
+                current_speed = target
+            
+            controller.set_fan_mode("manual")
+            success_count = controller.set_fan_speed(current_speed)
+            
+            # 输出执行结果
+            if success_count == config['fans_count']:
+                logging.info(f"服务器 {config['bmc_host']} 所有风扇({success_count}/{config['fans_count']})转速设置成功")
+            else:
+                logging.warning(f"服务器 {config['bmc_host']} 部分风扇设置失败，成功率：{success_count}/{config['fans_count']}")
         
+        # 获取当前状态
+        controller.get_fan_status()
+        
+    except Exception as e:
+        # 单个配置失败不影响其他配置
+        logging.error(f"配置 {index+1} ({config.get('bmc_host')}) 执行失败：{e}")
+
+def main():
+    setup_logging()
+    
+    try:
         # 加载配置数组
         configs = load_config()
         
@@ -244,10 +531,13 @@ def main():
         
         # 如果未指定转速，根据日期自动选择执行模式
         if target is None:
-            # 判断当前是否为周末或中国节假日
-            # 注意：is_chinese_holiday()函数在API返回type=1（周末）时也会返回False，
-            # 但API已经确认是周末，所以我们需要额外检查API返回的周末信息
-            if is_weekend() or is_holiday:
+            # 仅在需要自动判断时检查节假日状态（显示联网更新是否成功）
+            logging.info("正在检查节假日状态...")
+            # 调用is_chinese_holiday()函数获取最新的节假日数据
+            is_holiday = is_chinese_holiday()
+            
+            # 判断当前是否为周末或中国节假日（is_chinese_holiday()已包含周末判断）
+            if is_holiday:
                 target = 'auto'
                 logging.info(f"当前是周末或中国节假日，自动执行auto模式")
             else:
@@ -259,45 +549,18 @@ def main():
                     logging.error("未指定转速且配置文件中没有fan_speed字段")
                     sys.exit(1)
         
-        # 顺序执行每个配置
-        for i, config in enumerate(configs):
-            description = config.get('description', '未命名服务器')
-            logging.info(f"\n===== 执行配置 {i+1}/{len(configs)} - {description} =====")
-            
-            try:
-                # 创建控制器实例
-                controller = FanController(config)
-                
-                # 执行控制流程
-                controller.login()
-                
-                # 根据目标类型执行不同操作
-                if target == 'auto':
-                    controller.set_fan_mode("auto")
-                    logging.info(f"服务器 {config['bmc_host']} 的风扇已设置为自动模式")
-                else:
-                    # 如果当前配置有独立的fan_speed，则使用它
-                    if 'fan_speed' in config:
-                        current_speed = config['fan_speed']
-                    else:
-                        current_speed = target
-                    
-                    controller.set_fan_mode("manual")
-                    success_count = controller.set_fan_speed(current_speed)
-                    
-                    # 输出执行结果
-                    if success_count == config['fans_count']:
-                        logging.info(f"服务器 {config['bmc_host']} 所有风扇({success_count}/{config['fans_count']})转速设置成功")
-                    else:
-                        logging.warning(f"服务器 {config['bmc_host']} 部分风扇设置失败，成功率：{success_count}/{config['fans_count']}")
-                
-                # 获取当前状态
-                controller.get_fan_status()
-                
-            except Exception as e:
-                logging.error(f"配置 {i+1} 执行失败：{e}")
-                # 继续执行下一个配置
-                continue
+        # 并发执行每个配置，各服务器之间互不阻塞
+        with ThreadPoolExecutor(max_workers=max(len(configs), 1)) as executor:
+            futures = [
+                executor.submit(process_config, i, len(configs), config, target)
+                for i, config in enumerate(configs)
+            ]
+        
+        # 记录工作线程中未被捕获的异常，避免静默丢失
+        for i, future in enumerate(futures):
+            error = future.exception()
+            if error is not None:
+                logging.error(f"配置 {i+1} 执行失败：{error}")
         
         logging.info("\n所有配置执行完毕")
         